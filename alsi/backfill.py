@@ -0,0 +1,322 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+import pandas as pd
+from .mappings import Area
+from .pandas_client import AlsiPandasClient
+from .records import GAS_DAY_KEY
+from .timefilter import Timefilter
+
+SERIES_COLUMN = "code"
+
+
+def find_gaps(
+    frame: pd.DataFrame,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    max_merge: int = 0,
+    date_column: Optional[str] = None,
+) -> List[Timefilter]:
+    """Find missing gas days of a single series as a minimal set of windows
+
+    Consecutive missing days form one window. Windows separated by at most
+    `max_merge` present days are joined, trading a few refetched days for
+    fewer requests. Use `find_series_gaps` for frames holding several series.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        fetched or stored data of one series
+    start: Optional[datetime]
+        expected first day, defaults to the first day in the frame
+    end: Optional[datetime]
+        expected last day, defaults to the last day in the frame
+    max_merge: int
+        maximal number of present days between two joined windows
+    date_column: Optional[str]
+        column with the gas days, detected if not provided
+
+    Raises
+    ------
+    TypeError
+        if the date column is missing, `max_merge` is negative or the 'code'
+        column holds more than one series
+
+    Examples
+    --------
+    >>> from alsi.backfill import find_gaps
+    >>> windows = find_gaps(df, start=datetime(2022, 1, 1), max_merge=2)
+    """
+    if max_merge < 0:
+        raise TypeError("Invalid max_merge.")
+
+    _check_single_series(frame)
+
+    days = _gas_days(frame, date_column)
+
+    first = pd.Timestamp(start).normalize() if start else days.min()
+    last = pd.Timestamp(end).normalize() if end else days.max()
+
+    if pd.isnull(first) or pd.isnull(last) or first > last:
+        return []
+
+    missing = pd.date_range(first, last, freq="D").difference(
+        pd.DatetimeIndex(days.unique())
+    )
+
+    windows: List[Timefilter] = []
+
+    for day in missing:
+        if windows and (day - windows[-1].end).days <= max_merge + 1:
+            windows[-1] = windows[-1]._replace(end=day.to_pydatetime())
+        else:
+            windows.append(
+                Timefilter(day.to_pydatetime(), day.to_pydatetime(), 0)
+            )
+
+    return windows
+
+
+def find_series_gaps(
+    frame: pd.DataFrame,
+    by: Union[str, List[str]] = SERIES_COLUMN,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    max_merge: int = 0,
+    date_column: Optional[str] = None,
+) -> Dict[Any, List[Timefilter]]:
+    """Find missing gas days per series, see `find_gaps`
+
+    Without `start` and `end` every series is checked between its own first
+    and last day. Series without gaps are not included in the result.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        fetched or stored data
+    by: Union[str, List[str]]
+        column(s) identifying a series
+    start: Optional[datetime]
+        expected first day, defaults to the first day of each series
+    end: Optional[datetime]
+        expected last day, defaults to the last day of each series
+    max_merge: int
+        maximal number of present days between two joined windows
+    date_column: Optional[str]
+        column with the gas days, detected if not provided
+
+    Raises
+    ------
+    TypeError
+        if the date column is missing or `max_merge` is negative
+
+    Examples
+    --------
+    >>> from alsi.backfill import find_series_gaps
+    >>> windows = find_series_gaps(df, by='code')
+    >>> windows['BE']
+    """
+    column = _date_column(frame, date_column)
+    gaps: Dict[Any, List[Timefilter]] = {}
+
+    for key, series in frame.groupby(by, sort=False):
+        windows = find_gaps(
+            series.drop(columns=SERIES_COLUMN, errors="ignore"),
+            start,
+            end,
+            max_merge,
+            column,
+        )
+        if windows:
+            gaps[key] = windows
+
+    return gaps
+
+
+def find_duplicates(
+    frame: pd.DataFrame,
+    by: Optional[Union[str, List[str]]] = None,
+    date_column: Optional[str] = None,
+) -> pd.DataFrame:
+    """Return all rows which share their gas day with another row of the same series
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        fetched or stored data
+    by: Optional[Union[str, List[str]]]
+        column(s) identifying a series, defaults to 'code' if present
+    date_column: Optional[str]
+        column with the gas days, detected if not provided
+
+    Examples
+    --------
+    >>> from alsi.backfill import find_duplicates
+    >>> duplicates = find_duplicates(df, by='code')
+    """
+    keys = pd.DataFrame({"day": _gas_days(frame, date_column)})
+
+    if by is None and SERIES_COLUMN in frame.columns:
+        by = SERIES_COLUMN
+
+    if by is not None:
+        for column in [by] if isinstance(by, str) else by:
+            keys[column] = frame[column].values
+
+    return frame[keys.duplicated(keep=False).values]
+
+
+async def backfill_facility(
+    client: AlsiPandasClient,
+    frame: pd.DataFrame,
+    facility_code: str,
+    company_code: str,
+    country_code: Union["Area", str],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    max_merge: int = 0,
+    max_concurrency: int = 4,
+    date_column: Optional[str] = None,
+) -> pd.DataFrame:
+    """Refetch only the missing gas days of a facility and merge them into the frame
+
+    The gaps found by `find_gaps` are queried concurrently. Duplicate days
+    are dropped, keeping the most recently fetched row, and the result keeps
+    the day ordering of the input frame. The frame must hold a single series.
+
+    Parameters
+    ----------
+    client : AlsiPandasClient
+        client used for the requests
+    frame : pd.DataFrame
+        previously fetched data of the facility
+    facility_code : str
+        21 digit EIC code of the facility
+    company_code : str
+        21 digit EIC code of the company
+    country_code : Union['Area', str]
+        2 digit country code or the name of the country
+    start: Optional[datetime]
+        expected first day, defaults to the first day in the frame
+    end: Optional[datetime]
+        expected last day, defaults to the last day in the frame
+    max_merge: int
+        maximal number of present days between two joined windows
+    max_concurrency: int
+        maximal number of requests in flight
+    date_column: Optional[str]
+        column with the gas days, detected if not provided
+
+    Raises
+    ------
+    TypeError
+        if the date column is missing, a parameter is invalid or the frame
+        holds more than one series
+
+    Examples
+    --------
+    >>> from alsi.pandas_client import AlsiPandasClient
+    >>> from alsi.backfill import backfill_facility
+    >>> API_KEY='...'
+    >>> client = AlsiPandasClient(api_key=API_KEY)
+    >>> df = await client.query_data_for_facility(facility_code='18W000000000GVMT', company_code='21X0000000013368', country_code='es')
+    >>> df = await backfill_facility(client, df, facility_code='18W000000000GVMT', company_code='21X0000000013368', country_code='es')
+    """
+    if max_concurrency < 1:
+        raise TypeError("Invalid max_concurrency.")
+
+    column = _date_column(frame, date_column)
+    windows = find_gaps(frame, start, end, max_merge, column)
+
+    if not windows:
+        return frame
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(window: Timefilter) -> pd.DataFrame:
+        async with semaphore:
+            return await client.query_data_for_facility(
+                facility_code,
+                company_code,
+                country_code,
+                start=window.start,
+                end=window.end,
+            )
+
+    fetched = await asyncio.gather(*(fetch(window) for window in windows))
+
+    return _merge(frame, fetched, column)
+
+
+def _merge(
+    frame: pd.DataFrame, fetched: List[pd.DataFrame], column: str
+) -> pd.DataFrame:
+    days = _gas_days(frame, column)
+    descending = len(days) > 1 and days.iloc[0] > days.iloc[-1]
+
+    fetched = [_align(part, frame, column) for part in fetched]
+    merged = pd.concat([frame, *fetched], ignore_index=True)
+
+    if column not in merged.columns:
+        return merged
+
+    merged = merged.assign(_gas_day=_gas_days(merged, column).values)
+    merged = merged.drop_duplicates(subset="_gas_day", keep="last")
+    merged = merged.sort_values(
+        "_gas_day", ascending=not descending, kind="mergesort"
+    )
+
+    return merged.drop(columns="_gas_day").reset_index(drop=True)
+
+
+def _align(
+    part: pd.DataFrame, frame: pd.DataFrame, column: str
+) -> pd.DataFrame:
+    """Rename the gas day column of fetched rows and check their series"""
+    if part.empty:
+        return part
+
+    fetched_column = _date_column(part, None)
+    if fetched_column != column:
+        part = part.drop(columns=column, errors="ignore").rename(
+            columns={fetched_column: column}
+        )
+
+    if SERIES_COLUMN in frame.columns and SERIES_COLUMN in part.columns:
+        expected = set(frame[SERIES_COLUMN].dropna())
+        if expected and not set(part[SERIES_COLUMN].dropna()) <= expected:
+            raise TypeError("Fetched rows belong to another series.")
+
+    return part
+
+
+def _check_single_series(frame: pd.DataFrame) -> None:
+    if SERIES_COLUMN in frame.columns and frame[SERIES_COLUMN].nunique() > 1:
+        raise TypeError(
+            "Frame holds several series, use find_series_gaps instead."
+        )
+
+
+def _date_column(frame: pd.DataFrame, date_column: Optional[str]) -> str:
+    if date_column:
+        if date_column not in frame.columns and not frame.empty:
+            raise TypeError(f"Missing date column: {date_column}.")
+        return date_column
+
+    for column in (GAS_DAY_KEY, "gas_day"):
+        if column in frame.columns:
+            return column
+
+    if frame.empty:
+        return GAS_DAY_KEY
+
+    raise TypeError("Gas day column not found.")
+
+
+def _gas_days(frame: pd.DataFrame, date_column: Optional[str]) -> pd.Series:
+    column = _date_column(frame, date_column)
+
+    if column not in frame.columns:
+        return pd.Series([], dtype="datetime64[ns]")
+
+    return pd.to_datetime(frame[column]).dt.normalize()
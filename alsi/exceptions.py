@@ -4,3 +4,7 @@ class AccessDeniedException(Exception):
 
 class InvalidCountryException(Exception):
     pass
+
+
+class MissingFixtureException(Exception):
+    pass
@@ -2,12 +2,19 @@ from typing import Optional, Union
 from typing_extensions import Literal
 from .raw_client import AlsiRawClient
 from .mappings import Area
+from .records import GasDayRecords
 import pandas as pd
 from datetime import datetime
 
 
 class AlsiPandasClient(AlsiRawClient):
-    """Client to perform API calls and return dataframes for ALSI API: https://alsi.gie.eu/#/api"""
+    """Client to perform API calls and return dataframes for ALSI API: https://alsi.gie.eu/#/api
+
+    With `typed_results=True` the dataframes are built by
+    `alsi.records.records_to_dataframe`. Their columns are the snake case
+    fields of `alsi.records.GasDayRecord` (e.g. 'gas_day', 'lng_inventory')
+    instead of the API names, and fields such as 'url' and 'info' are dropped.
+    """
 
     async def query_agg_data_for_europe_or_noneurope(
         self,
@@ -46,7 +53,7 @@ class AlsiPandasClient(AlsiRawClient):
             europe, start, end, limit
         )
 
-        return pd.DataFrame(json_result)
+        return _to_dataframe(json_result)
 
     async def query_agg_data_by_country(
         self,
@@ -84,7 +91,7 @@ class AlsiPandasClient(AlsiRawClient):
             country_code, start, end, limit
         )
 
-        return pd.DataFrame(json_result)
+        return _to_dataframe(json_result)
 
     async def query_data_by_company_and_country(
         self,
@@ -126,7 +133,7 @@ class AlsiPandasClient(AlsiRawClient):
             company_code, country_code, start, end, limit
         )
 
-        return pd.DataFrame(json_result)
+        return _to_dataframe(json_result)
 
     async def query_data_for_facility(
         self,
@@ -170,4 +177,11 @@ class AlsiPandasClient(AlsiRawClient):
             facility_code, company_code, country_code, start, end, limit
         )
 
-        return pd.DataFrame(json_result)
+        return _to_dataframe(json_result)
+
+
+def _to_dataframe(result) -> pd.DataFrame:
+    if isinstance(result, GasDayRecords):
+        return result.to_dataframe()
+
+    return pd.DataFrame(result)
@@ -1,14 +1,31 @@
 from typing import Optional, Union
 from typing_extensions import Literal
 import aiohttp
+import json
 from datetime import datetime
 from .exceptions import AccessDeniedException
 from .timefilter import Timefilter
 from .mappings import retrieve_country, Area
+from .records import parse_records
+from .transport import AlsiTransport, AiohttpTransport
 
 
 class AlsiRawClient:
-    """Client to perform API calls and return JSON data for ALSI API: https://alsi.gie.eu/#/api"""
+    """Client to perform API calls and return JSON data for ALSI API: https://alsi.gie.eu/#/api
+
+    Parameters
+    ----------
+    api_key : str
+        ALSI API key
+    session : Optional[aiohttp.ClientSession]
+        session to reuse for all requests
+    typed_results : bool
+        return rows as `alsi.records.GasDayRecords` instead of dicts. The
+        pandas client then returns frames with the record field names.
+    transport : Optional[AlsiTransport]
+        transport performing the requests, e.g. `alsi.transport.ReplayTransport`
+        for offline use. The session is ignored if a transport is provided.
+    """
 
     BASE_URL = "https://alsi.gie.eu/api/data"
 
@@ -16,20 +33,20 @@ class AlsiRawClient:
         self,
         api_key: str,
         session: Optional[aiohttp.ClientSession] = None,
+        typed_results: bool = False,
+        transport: Optional[AlsiTransport] = None,
     ) -> None:
 
         if not api_key:
             raise TypeError("No API key provided.")
 
         self.__api_key = api_key
+        self.__typed_results = typed_results
 
-        self.__session = (
-            aiohttp.ClientSession(
-                raise_for_status=True,
-                headers={"x-key": self.__api_key},
-            )
-            if not session
-            else session
+        self.__transport = (
+            AiohttpTransport(self.__api_key, session)
+            if not transport
+            else transport
         )
 
     async def query_data_for_facility(
@@ -242,12 +259,18 @@ class AlsiRawClient:
 
         url = f"{AlsiRawClient.BASE_URL}/{'/'.join(path_segments)}"
 
-        async with self.__session.get(url, params=params) as res:
-            if res.status < 400:
-                if "access denied" in (await res.text()):
-                    raise AccessDeniedException("Check if API key is invalid.")
+        text = await self.__transport.get(url, params)
 
-                return await res.json()
+        if text is not None:
+            if "access denied" in text:
+                raise AccessDeniedException("Check if API key is invalid.")
+
+            result = json.loads(text)
+
+            if self.__typed_results and isinstance(result, list):
+                return parse_records(result)
+
+            return result
 
     @staticmethod
     def __invalid_timefilter(timefilter: tuple) -> bool:
@@ -263,5 +286,4 @@ class AlsiRawClient:
 
     async def close_session(self) -> None:
         """Close the session."""
-        if self.__session:
-            await self.__session.close()
+        await self.__transport.close()
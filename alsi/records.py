@@ -0,0 +1,206 @@
+import sys
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+GAS_DAY_KEY = "gasDayStartedOn"
+
+
+@dataclass
+class GasDayRecord:
+    """Single gas day row of an ALSI response with pre-parsed fields"""
+
+    __slots__ = (
+        "code",
+        "name",
+        "gas_day",
+        "lng_inventory",
+        "send_out",
+        "dtmi",
+        "dtrs",
+        "status",
+    )
+
+    code: Optional[str]
+    name: Optional[str]
+    gas_day: Optional[date]
+    lng_inventory: Optional[float]
+    send_out: Optional[float]
+    dtmi: Optional[float]
+    dtrs: Optional[float]
+    status: Optional[str]
+
+
+RECORD_FIELDS = tuple(field.name for field in fields(GasDayRecord))
+
+
+class GasDayRecords(List[GasDayRecord]):
+    """List of `GasDayRecord` rows with conversions to pandas and NumPy
+
+    Slices, concatenations and copies are `GasDayRecords` as well.
+    """
+
+    def __getitem__(self, index):
+        item = super().__getitem__(index)
+
+        return GasDayRecords(item) if isinstance(index, slice) else item
+
+    def __add__(self, other):
+        return GasDayRecords([*self, *other])
+
+    def copy(self) -> "GasDayRecords":
+        return GasDayRecords(self)
+
+    def to_numpy(self) -> Dict[str, np.ndarray]:
+        """Convert the rows to a mapping of column name to NumPy array
+
+        See `records_to_numpy`.
+
+        Examples
+        --------
+        >>> from alsi.raw_client import AlsiRawClient
+        >>> API_KEY='...'
+        >>> client = AlsiRawClient(api_key=API_KEY, typed_results=True)
+        >>> result = await client.query_agg_data_by_country(country_code='be')
+        >>> columns = result.to_numpy()
+        """
+        return records_to_numpy(self)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert the rows to a dataframe with typed columns
+
+        See `records_to_dataframe`.
+
+        Examples
+        --------
+        >>> from alsi.raw_client import AlsiRawClient
+        >>> API_KEY='...'
+        >>> client = AlsiRawClient(api_key=API_KEY, typed_results=True)
+        >>> result = await client.query_agg_data_by_country(country_code='be')
+        >>> df = result.to_dataframe()
+        """
+        return records_to_dataframe(self)
+
+
+def records_to_numpy(
+    records: Sequence[GasDayRecord],
+) -> Dict[str, np.ndarray]:
+    """Convert rows to a mapping of column name to NumPy array
+
+    Numeric columns are float arrays with NaN for missing values, the
+    gas day column is a `datetime64[D]` array.
+
+    Parameters
+    ----------
+    records : Sequence[GasDayRecord]
+        rows to convert
+
+    Examples
+    --------
+    >>> from alsi.records import records_to_numpy
+    >>> columns = records_to_numpy(records[:100])
+    """
+    columns: Dict[str, np.ndarray] = {}
+
+    for column in RECORD_FIELDS:
+        values = [getattr(record, column) for record in records]
+
+        if column == "gas_day":
+            columns[column] = np.array(values, dtype="datetime64[D]")
+        elif column in ("code", "name", "status"):
+            columns[column] = np.array(values, dtype=object)
+        else:
+            columns[column] = np.array(values, dtype=float)
+
+    return columns
+
+
+def records_to_dataframe(records: Sequence[GasDayRecord]) -> pd.DataFrame:
+    """Convert rows to a dataframe with one column per `GasDayRecord` field
+
+    Columns use the snake case field names of `GasDayRecord`, not the names
+    of the API, and fields dropped by `parse_records` are not included.
+
+    Parameters
+    ----------
+    records : Sequence[GasDayRecord]
+        rows to convert
+
+    Examples
+    --------
+    >>> from alsi.records import records_to_dataframe
+    >>> df = records_to_dataframe(records[:100])
+    """
+    columns = records_to_numpy(records)
+    columns["gas_day"] = columns["gas_day"].astype("datetime64[ns]")
+
+    return pd.DataFrame(columns, columns=list(RECORD_FIELDS))
+
+
+def parse_records(rows: Iterable[Dict[str, Any]]) -> GasDayRecords:
+    """Parse raw JSON rows from the ALSI API into `GasDayRecord` objects
+
+    Numeric fields are converted to floats, gas days to dates and repeated
+    code strings are interned so that rows share a single copy. Keys which
+    are not part of `GasDayRecord`, e.g. 'url' and 'info', are dropped.
+    Values which cannot be parsed are stored as None.
+
+    Parameters
+    ----------
+    rows : Iterable[Dict[str, Any]]
+        rows as returned by the API
+
+    Examples
+    --------
+    >>> from alsi.records import parse_records
+    >>> records = parse_records([{'gasDayStartedOn': '2022-01-01', 'lngInventory': '10.5'}])
+    """
+    gas_days: Dict[str, Optional[date]] = {}
+    records = GasDayRecords()
+
+    for row in rows:
+        raw_day = row.get(GAS_DAY_KEY)
+        gas_day = None
+
+        if isinstance(raw_day, str):
+            if raw_day not in gas_days:
+                gas_days[raw_day] = _to_date(raw_day)
+            gas_day = gas_days[raw_day]
+
+        records.append(
+            GasDayRecord(
+                code=_intern(row.get("code")),
+                name=_intern(row.get("name")),
+                gas_day=gas_day,
+                lng_inventory=_to_float(row.get("lngInventory")),
+                send_out=_to_float(row.get("sendOut")),
+                dtmi=_to_float(row.get("dtmi")),
+                dtrs=_to_float(row.get("dtrs")),
+                status=_intern(row.get("status")),
+            )
+        )
+
+    return records
+
+
+def _intern(value: Any) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else None
+
+
+def _to_date(value: str) -> Optional[date]:
+    try:
+        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or value == "" or value == "-":
+        return None
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,266 @@
+import asyncio
+import inspect
+import logging
+from datetime import datetime, time, timedelta, timezone
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+import pandas as pd
+from .raw_client import AlsiRawClient
+
+logger = logging.getLogger(__name__)
+
+
+class WatchTarget(NamedTuple):
+    """Series watched by `AlsiRefresher`
+
+    `method` is the name of a client query method and `kwargs` its keyword
+    arguments. `publication_time` is the UTC time of day at which new data
+    for the series is expected.
+    """
+
+    method: str
+    kwargs: Dict[str, Any]
+    interval: float
+    publication_time: Optional[time] = None
+
+
+class RefreshUpdate(NamedTuple):
+    """Changed result of a watched series published to subscribers"""
+
+    target: WatchTarget
+    result: Any
+    refreshed_at: datetime
+
+
+Subscriber = Union[
+    Callable[[RefreshUpdate], Optional[Awaitable[None]]],
+    "asyncio.Queue[RefreshUpdate]",
+]
+
+_PUBLICATION = 0
+_REGULAR = 1
+
+
+class AlsiRefresher:
+    """Periodically refresh a set of watched series and publish changes
+
+    All targets are served by a single task on the running event loop using
+    the session of the given client. Requests are started at least
+    `min_spacing` seconds apart and a target whose publication time has just
+    passed is refreshed before targets that are merely due.
+
+    Failing queries and subscribers are logged and do not stop the refresh.
+    If a bounded queue is full, its oldest update is replaced.
+
+    Parameters
+    ----------
+    client : AlsiRawClient
+        raw or pandas client used for the requests
+    targets : Iterable[WatchTarget]
+        series to refresh
+    min_spacing : float
+        minimal delay in seconds between two requests
+    publication_grace : float
+        delay in seconds after a publication time before refreshing
+
+    Raises
+    ------
+    TypeError
+        if a target method is not a query method of the client or its
+        interval is not positive
+
+    Examples
+    --------
+    >>> from alsi.pandas_client import AlsiPandasClient
+    >>> from alsi.refresher import AlsiRefresher, WatchTarget
+    >>> from datetime import time
+    >>> API_KEY='...'
+    >>> client = AlsiPandasClient(api_key=API_KEY)
+    >>> target = WatchTarget('query_agg_data_by_country', {'country_code': 'be'}, 3600, time(18, 0))
+    >>> refresher = AlsiRefresher(client, [target])
+    >>> refresher.subscribe(print)
+    >>> refresher.start()
+    """
+
+    def __init__(
+        self,
+        client: AlsiRawClient,
+        targets: Iterable[WatchTarget],
+        min_spacing: float = 1.0,
+        publication_grace: float = 60.0,
+    ) -> None:
+        self.__client = client
+        self.__targets = list(targets)
+        self.__min_spacing = min_spacing
+        self.__publication_grace = publication_grace
+        self.__subscribers: List[Subscriber] = []
+        self.__last_results: Dict[int, Any] = {}
+        self.__task: Optional["asyncio.Task[None]"] = None
+
+        for target in self.__targets:
+            if not target.method.startswith("query_") or not hasattr(
+                client, target.method
+            ):
+                raise TypeError(f"Invalid query method: {target.method}.")
+
+            if target.interval <= 0:
+                raise TypeError("Refresh interval must be positive.")
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        """Register a callback, coroutine function or queue for updates"""
+        self.__subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Remove a previously registered subscriber"""
+        self.__subscribers.remove(subscriber)
+
+    def start(self) -> "asyncio.Task[None]":
+        """Start refreshing in a background task on the running loop"""
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.ensure_future(self.run())
+
+        return self.__task
+
+    async def stop(self) -> None:
+        """Stop the background task started by `start`"""
+        if self.__task is None:
+            return
+
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+
+    async def run(self) -> None:
+        """Refresh the watched targets until cancelled"""
+        loop = asyncio.get_event_loop()
+        now = loop.time()
+
+        # [due time, priority] per target, initial requests are staggered
+        schedule = [
+            [now + index * self.__min_spacing, _REGULAR]
+            for index in range(len(self.__targets))
+        ]
+        last_request = None
+
+        while schedule:
+            now = loop.time()
+            index = _next_index(schedule, now)
+            start_at = schedule[index][0]
+
+            if last_request is not None:
+                start_at = max(start_at, last_request + self.__min_spacing)
+
+            if start_at > now:
+                await asyncio.sleep(start_at - now)
+                continue
+
+            last_request = loop.time()
+            await self.__refresh(index)
+            schedule[index] = self.__next_due(
+                self.__targets[index],
+                last_request,
+                datetime.now(timezone.utc),
+            )
+
+    async def __refresh(self, index: int) -> None:
+        target = self.__targets[index]
+
+        try:
+            result = await getattr(self.__client, target.method)(
+                **target.kwargs
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Refreshing %s failed.", target)
+            return
+
+        if index in self.__last_results and _same_result(
+            self.__last_results[index], result
+        ):
+            return
+
+        self.__last_results[index] = result
+        update = RefreshUpdate(target, result, datetime.now(timezone.utc))
+
+        for subscriber in list(self.__subscribers):
+            try:
+                if isinstance(subscriber, asyncio.Queue):
+                    _put_latest(subscriber, update)
+                    continue
+
+                published = subscriber(update)
+                if inspect.isawaitable(published):
+                    await published
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Publishing to %s failed.", subscriber)
+
+    def __next_due(
+        self, target: WatchTarget, requested_at: float, wall_now: datetime
+    ) -> list:
+        due = requested_at + target.interval
+
+        if target.publication_time is None:
+            return [due, _REGULAR]
+
+        grace = timedelta(seconds=self.__publication_grace)
+        refresh_at = (
+            datetime.combine(
+                wall_now.date(), target.publication_time, timezone.utc
+            )
+            + grace
+        )
+        if refresh_at <= wall_now:
+            refresh_at += timedelta(days=1)
+
+        delay = (refresh_at - wall_now).total_seconds()
+
+        if delay < target.interval:
+            return [requested_at + delay, _PUBLICATION]
+
+        return [due, _REGULAR]
+
+
+def _next_index(schedule: List[list], now: float) -> int:
+    """Index of the next entry, publications first among due entries"""
+
+    def key(i: int) -> tuple:
+        due, priority = schedule[i]
+        if due > now:
+            # nothing to prioritise before an entry is due
+            return (True, 0, due)
+        return (False, priority, due)
+
+    return min(range(len(schedule)), key=key)
+
+
+def _put_latest(queue: "asyncio.Queue[RefreshUpdate]", update) -> None:
+    """Put the update, replacing the oldest one if the queue is full"""
+    if queue.full():
+        queue.get_nowait()
+        queue.task_done()
+
+    queue.put_nowait(update)
+
+
+def _same_result(previous: Any, current: Any) -> bool:
+    if isinstance(previous, pd.DataFrame) and isinstance(
+        current, pd.DataFrame
+    ):
+        return previous.equals(current)
+
+    return previous == current
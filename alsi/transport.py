@@ -0,0 +1,159 @@
+import asyncio
+import gzip
+from abc import ABC, abstractmethod
+import json
+import os
+from typing import Dict, Optional, Union
+from urllib.parse import urlencode
+import aiohttp
+from .exceptions import MissingFixtureException
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class AlsiTransport(ABC):
+    """Interface used by `AlsiRawClient` to fetch the body of a GET request"""
+
+    @abstractmethod
+    async def get(self, url: str, params: Dict[str, str]) -> Optional[str]:
+        """Return the response text or None if the request failed"""
+
+    async def close(self) -> None:
+        """Release the resources held by the transport"""
+
+
+class AiohttpTransport(AlsiTransport):
+    """Transport performing requests with an aiohttp session
+
+    Parameters
+    ----------
+    api_key : str
+        ALSI API key, used if no session is provided
+    session : Optional[aiohttp.ClientSession]
+        session to reuse for all requests
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        self.__session = (
+            aiohttp.ClientSession(
+                raise_for_status=True,
+                headers={"x-key": api_key},
+            )
+            if not session
+            else session
+        )
+
+    async def get(self, url: str, params: Dict[str, str]) -> Optional[str]:
+        async with self.__session.get(url, params=params) as res:
+            if res.status < 400:
+                return await res.text()
+
+        return None
+
+    async def close(self) -> None:
+        if self.__session:
+            await self.__session.close()
+
+
+class RecordingTransport(AlsiTransport):
+    """Transport saving the responses of another transport to a fixture file
+
+    Responses are kept in memory and written as gzip compressed JSON on
+    `save` or `close`. Responses already present in the file are kept.
+
+    Parameters
+    ----------
+    transport : AlsiTransport
+        transport performing the actual requests
+    path : PathLike
+        fixture file, e.g. 'tests/fixtures/raw_client.json.gz'
+
+    Examples
+    --------
+    >>> from alsi.raw_client import AlsiRawClient
+    >>> from alsi.transport import AiohttpTransport, RecordingTransport
+    >>> API_KEY='...'
+    >>> transport = RecordingTransport(AiohttpTransport(API_KEY), 'fixtures.json.gz')
+    >>> client = AlsiRawClient(api_key=API_KEY, transport=transport)
+    """
+
+    def __init__(self, transport: AlsiTransport, path: PathLike) -> None:
+        self.__transport = transport
+        self.__path = path
+        self.__responses = load_fixtures(path) if os.path.exists(path) else {}
+
+    async def get(self, url: str, params: Dict[str, str]) -> Optional[str]:
+        text = await self.__transport.get(url, params)
+        self.__responses[request_key(url, params)] = text
+
+        return text
+
+    def save(self) -> None:
+        """Write the recorded responses to the fixture file"""
+        directory = os.path.dirname(self.__path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with gzip.open(self.__path, "wt", encoding="utf-8") as file:
+            json.dump(self.__responses, file, sort_keys=True)
+
+    async def close(self) -> None:
+        self.save()
+        await self.__transport.close()
+
+
+class ReplayTransport(AlsiTransport):
+    """Transport serving responses from a fixture file without network access
+
+    Parameters
+    ----------
+    path : PathLike
+        fixture file written by `RecordingTransport`
+    latency : float
+        delay in seconds added to every response
+
+    Raises
+    ------
+    MissingFixtureException
+        if a request was not recorded
+
+    Examples
+    --------
+    >>> from alsi.pandas_client import AlsiPandasClient
+    >>> from alsi.transport import ReplayTransport
+    >>> transport = ReplayTransport('fixtures.json.gz', latency=0.05)
+    >>> client = AlsiPandasClient(api_key='offline', transport=transport)
+    """
+
+    def __init__(self, path: PathLike, latency: float = 0.0) -> None:
+        self.__responses = load_fixtures(path)
+        self.__latency = latency
+
+    async def get(self, url: str, params: Dict[str, str]) -> Optional[str]:
+        key = request_key(url, params)
+
+        if key not in self.__responses:
+            raise MissingFixtureException(f"No recorded response for {key}.")
+
+        if self.__latency:
+            await asyncio.sleep(self.__latency)
+
+        return self.__responses[key]
+
+
+def request_key(url: str, params: Dict[str, str]) -> str:
+    """Key identifying a request in a fixture file"""
+    if not params:
+        return url
+
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+def load_fixtures(path: PathLike) -> Dict[str, Optional[str]]:
+    """Read the responses of a fixture file"""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return json.load(file)
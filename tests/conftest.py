@@ -0,0 +1,42 @@
+from alsi.transport import (
+    AiohttpTransport,
+    RecordingTransport,
+    ReplayTransport,
+)
+import pytest, os
+
+API_KEY = os.getenv("ALSI_KEY")
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def pytest_configure(config):
+    if os.getenv("ALSI_RECORD") and not API_KEY:
+        raise pytest.UsageError("ALSI_RECORD requires ALSI_KEY to be set.")
+
+
+@pytest.fixture(scope="session")
+def transport_factory():
+    """Create the transport of the live test clients
+
+    With `ALSI_RECORD` set, responses of the live API are saved to
+    `tests/fixtures/<name>.json.gz`. Without `ALSI_KEY`, recorded fixtures
+    are replayed with an optional `ALSI_REPLAY_LATENCY` in seconds, and the
+    tests are skipped if there is no fixture to replay.
+    """
+
+    def create(name):
+        path = os.path.join(FIXTURES, f"{name}.json.gz")
+
+        if os.getenv("ALSI_RECORD"):
+            return RecordingTransport(AiohttpTransport(API_KEY), path)
+
+        if API_KEY:
+            return None
+
+        if not os.path.exists(path):
+            pytest.skip(f"ALSI_KEY not set and no fixture at {path}.")
+
+        latency = float(os.getenv("ALSI_REPLAY_LATENCY", "0"))
+        return ReplayTransport(path, latency)
+
+    return create
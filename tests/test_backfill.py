@@ -0,0 +1,174 @@
+from alsi.backfill import (
+    backfill_facility,
+    find_duplicates,
+    find_gaps,
+    find_series_gaps,
+)
+from alsi.pandas_client import AlsiPandasClient
+from alsi.timefilter import Timefilter
+from datetime import datetime
+import pandas as pd
+import pytest
+
+
+def frame(*days):
+    return pd.DataFrame(
+        {
+            "code": "BE",
+            "gasDayStartedOn": [f"2022-01-{day:02d}" for day in days],
+            "lngInventory": [str(day) for day in days],
+        }
+    )
+
+
+class FakeClient(AlsiPandasClient):
+    def __init__(self):
+        super().__init__("dummy_key")
+        self.windows = []
+
+    async def query_data_for_facility(
+        self, facility_code, company_code, country_code, start, end, **kwargs
+    ):
+        self.windows.append((start, end))
+        days = pd.date_range(start, end, freq="D").day
+        return frame(*reversed(days))
+
+
+class TestBackfill:
+    def test_find_gaps(self):
+        df = frame(10, 9, 6, 5, 3, 1)
+
+        assert find_gaps(df) == [
+            Timefilter(datetime(2022, 1, 2), datetime(2022, 1, 2), 0),
+            Timefilter(datetime(2022, 1, 4), datetime(2022, 1, 4), 0),
+            Timefilter(datetime(2022, 1, 7), datetime(2022, 1, 8), 0),
+        ]
+        assert find_gaps(df, max_merge=1) == [
+            Timefilter(datetime(2022, 1, 2), datetime(2022, 1, 4), 0),
+            Timefilter(datetime(2022, 1, 7), datetime(2022, 1, 8), 0),
+        ]
+        assert find_gaps(df, end=datetime(2022, 1, 12))[-1] == Timefilter(
+            datetime(2022, 1, 11), datetime(2022, 1, 12), 0
+        )
+        assert find_gaps(frame(1, 2, 3)) == []
+
+        with pytest.raises(TypeError):
+            find_gaps(df, max_merge=-1)
+
+        with pytest.raises(TypeError):
+            find_gaps(df, date_column="missing")
+
+    def test_find_series_gaps(self):
+        fr = frame(4, 1).assign(code="FR")
+        df = pd.concat([frame(5, 3, 1), fr], ignore_index=True)
+
+        with pytest.raises(TypeError):
+            find_gaps(df)
+
+        assert find_series_gaps(df, by="code") == {
+            "BE": [
+                Timefilter(datetime(2022, 1, 2), datetime(2022, 1, 2), 0),
+                Timefilter(datetime(2022, 1, 4), datetime(2022, 1, 4), 0),
+            ],
+            "FR": [Timefilter(datetime(2022, 1, 2), datetime(2022, 1, 3), 0)],
+        }
+        assert list(find_series_gaps(df, end=datetime(2022, 1, 5))) == [
+            "BE",
+            "FR",
+        ]
+        assert find_series_gaps(frame(1, 2)) == {}
+
+    def test_find_duplicates(self):
+        df = pd.concat([frame(3, 2, 1), frame(2)], ignore_index=True)
+        df.loc[2, "code"] = "FR"
+
+        duplicates = find_duplicates(df, by="code")
+
+        assert list(duplicates.index) == [1, 3]
+        assert list(find_duplicates(df).index) == [1, 3]
+
+        # the same day in two series is not a duplicate by default
+        df.loc[3, "code"] = "FR"
+        assert find_duplicates(df).empty
+        assert list(find_duplicates(df.drop(columns="code")).index) == [1, 3]
+        assert find_duplicates(frame(1, 2)).empty
+
+    @pytest.mark.asyncio
+    async def test_backfill_facility(self):
+        client = FakeClient()
+        df = frame(10, 9, 6, 5, 3, 1)
+
+        result = await backfill_facility(
+            client,
+            df,
+            facility_code="63W631527814486R",
+            company_code="21X0000000010679",
+            country_code="FR",
+            max_merge=1,
+        )
+        await client.close_session()
+
+        assert client.windows == [
+            (datetime(2022, 1, 2), datetime(2022, 1, 4)),
+            (datetime(2022, 1, 7), datetime(2022, 1, 8)),
+        ]
+        assert list(result["gasDayStartedOn"]) == [
+            f"2022-01-{day:02d}" for day in range(10, 0, -1)
+        ]
+        assert find_gaps(result) == []
+
+    @pytest.mark.asyncio
+    async def test_backfill_several_series(self):
+        client = FakeClient()
+        df = pd.concat(
+            [frame(3, 1), frame(3, 1).assign(code="FR")], ignore_index=True
+        )
+
+        with pytest.raises(TypeError):
+            await backfill_facility(
+                client,
+                df,
+                facility_code="63W631527814486R",
+                company_code="21X0000000010679",
+                country_code="FR",
+            )
+        await client.close_session()
+
+        assert client.windows == []
+
+    @pytest.mark.asyncio
+    async def test_backfill_custom_date_column(self):
+        client = FakeClient()
+        df = frame(4, 1).rename(columns={"gasDayStartedOn": "day"})
+
+        result = await backfill_facility(
+            client,
+            df,
+            facility_code="63W631527814486R",
+            company_code="21X0000000010679",
+            country_code="FR",
+            date_column="day",
+        )
+        await client.close_session()
+
+        assert list(result["day"]) == [
+            f"2022-01-{day:02d}" for day in range(4, 0, -1)
+        ]
+        assert "gasDayStartedOn" not in result.columns
+
+    @pytest.mark.asyncio
+    async def test_backfill_without_series_column(self):
+        client = FakeClient()
+        df = frame(4, 1).drop(columns="code")
+
+        result = await backfill_facility(
+            client,
+            df,
+            facility_code="63W631527814486R",
+            company_code="21X0000000010679",
+            country_code="FR",
+        )
+        await client.close_session()
+
+        assert len(result) == 4
+        assert find_gaps(result) == []
@@ -9,9 +9,14 @@ API_KEY = os.getenv("ALSI_KEY")
 class TestPandasClient:
     @pytest.mark.asyncio
     @pytest_asyncio.fixture(scope="class", autouse=True)
-    async def client(self):
+    async def client(self, transport_factory):
+        transport = transport_factory("pandas_client")
         dummy_client = AlsiPandasClient("dummy_key")
-        pandas_client = AlsiPandasClient(API_KEY)
+        pandas_client = (
+            AlsiPandasClient(API_KEY or "offline", transport=transport)
+            if transport
+            else AlsiPandasClient(API_KEY)
+        )
 
         yield pandas_client, dummy_client
 
@@ -9,9 +9,14 @@ API_KEY = os.getenv("ALSI_KEY")
 class TestRawClient:
     @pytest.mark.asyncio
     @pytest_asyncio.fixture(scope="class")
-    async def client(self):
+    async def client(self, transport_factory):
+        transport = transport_factory("raw_client")
         dummy_client = AlsiRawClient("dummy_key")
-        raw_client = AlsiRawClient(API_KEY)
+        raw_client = (
+            AlsiRawClient(API_KEY or "offline", transport=transport)
+            if transport
+            else AlsiRawClient(API_KEY)
+        )
 
         yield raw_client, dummy_client
 
@@ -0,0 +1,86 @@
+from alsi.records import (
+    GasDayRecord,
+    GasDayRecords,
+    parse_records,
+    records_to_dataframe,
+)
+from datetime import date
+import math
+
+ROWS = [
+    {
+        "name": "Belgium",
+        "code": "BE",
+        "gasDayStartedOn": "2022-01-02",
+        "lngInventory": "1234.5",
+        "sendOut": "-",
+        "dtmi": 10,
+        "dtrs": "",
+        "status": "C",
+        "info": [],
+    },
+    {
+        "name": "Belgium",
+        "code": "BE",
+        "gasDayStartedOn": "2022-01-01",
+        "lngInventory": "1000",
+        "sendOut": "12.25",
+        "status": "C",
+    },
+]
+
+
+class TestRecords:
+    def test_parse_records(self):
+        records = parse_records(ROWS)
+
+        assert isinstance(records, GasDayRecords)
+        assert records[0] == GasDayRecord(
+            code="BE",
+            name="Belgium",
+            gas_day=date(2022, 1, 2),
+            lng_inventory=1234.5,
+            send_out=None,
+            dtmi=10.0,
+            dtrs=None,
+            status="C",
+        )
+        assert records[1].dtmi is None
+        assert records[0].code is records[1].code
+        assert not hasattr(records[0], "__dict__")
+
+    def test_to_numpy(self):
+        columns = parse_records(ROWS).to_numpy()
+
+        assert str(columns["gas_day"].dtype) == "datetime64[D]"
+        assert math.isnan(columns["send_out"][0])
+        assert columns["send_out"][1] == 12.25
+
+    def test_to_dataframe(self):
+        df = parse_records(ROWS).to_dataframe()
+
+        assert list(df["code"]) == ["BE", "BE"]
+        assert str(df["gas_day"].dtype) == "datetime64[ns]"
+        assert df["lng_inventory"].sum() == 2234.5
+
+        assert parse_records([]).to_dataframe().empty
+
+    def test_invalid_gas_day(self):
+        records = parse_records(
+            [
+                {"gasDayStartedOn": "2022-01-01T06:00:00"},
+                {"gasDayStartedOn": "01.01.2022"},
+            ]
+        )
+
+        assert records[0].gas_day == date(2022, 1, 1)
+        assert records[1].gas_day is None
+
+    def test_slicing(self):
+        records = parse_records(ROWS)
+
+        assert isinstance(records[:1], GasDayRecords)
+        assert isinstance(records + records, GasDayRecords)
+        assert isinstance(records.copy(), GasDayRecords)
+        assert len(records[:1].to_dataframe()) == 1
+        assert len(records_to_dataframe(list(records))) == 2
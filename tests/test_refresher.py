@@ -0,0 +1,159 @@
+from alsi.refresher import AlsiRefresher, RefreshUpdate, WatchTarget
+from alsi.raw_client import AlsiRawClient
+from datetime import datetime, timedelta, timezone
+import pytest, asyncio
+
+METHOD = "query_agg_data_by_country"
+
+
+class FakeClient(AlsiRawClient):
+    def __init__(self, calls_until_done=6):
+        super().__init__("dummy_key")
+        self.calls = []
+        self.started = []
+        self.done = asyncio.Event()
+        self.calls_until_done = calls_until_done
+
+    async def query_agg_data_by_country(self, country_code, **kwargs):
+        self.calls.append(country_code)
+        self.started.append(asyncio.get_event_loop().time())
+        if len(self.calls) >= self.calls_until_done:
+            self.done.set()
+        return [{"code": country_code}]
+
+
+def targets(*codes, interval=0.01):
+    return [
+        WatchTarget(METHOD, {"country_code": code}, interval) for code in codes
+    ]
+
+
+async def run_until_done(refresher, client):
+    refresher.start()
+    await asyncio.wait_for(client.done.wait(), timeout=5)
+    await refresher.stop()
+    await client.close_session()
+
+
+class TestRefresher:
+    @pytest.mark.asyncio
+    async def test_invalid_target(self):
+        client = FakeClient()
+
+        with pytest.raises(TypeError):
+            AlsiRefresher(client, [WatchTarget("close_session", {}, 1)])
+
+        with pytest.raises(TypeError):
+            AlsiRefresher(client, [WatchTarget(METHOD, {}, 0)])
+
+        await client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_refresh_and_publish(self):
+        client = FakeClient()
+        refresher = AlsiRefresher(
+            client, targets("be", "fr", "es"), min_spacing=0.001
+        )
+
+        queue: asyncio.Queue = asyncio.Queue()
+        callback_updates = []
+        refresher.subscribe(queue)
+        refresher.subscribe(callback_updates.append)
+
+        await run_until_done(refresher, client)
+
+        assert client.calls[:3] == ["be", "fr", "es"]
+
+        updates = []
+        while not queue.empty():
+            updates.append(queue.get_nowait())
+
+        assert updates == callback_updates
+        assert all(isinstance(update, RefreshUpdate) for update in updates)
+        # unchanged results are not published again
+        assert [u.target.kwargs["country_code"] for u in updates] == [
+            "be",
+            "fr",
+            "es",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_min_spacing(self):
+        client = FakeClient(calls_until_done=5)
+        refresher = AlsiRefresher(
+            client, targets("be", "fr"), min_spacing=0.05
+        )
+
+        await run_until_done(refresher, client)
+
+        gaps = [b - a for a, b in zip(client.started, client.started[1:])]
+        assert len(gaps) >= 4
+        assert min(gaps) >= 0.05 - 0.005
+
+    @pytest.mark.asyncio
+    async def test_failing_subscribers(self):
+        client = FakeClient(calls_until_done=4)
+        refresher = AlsiRefresher(
+            client, targets("be", "fr", "es"), min_spacing=0.001
+        )
+
+        def failing(update):
+            raise ValueError("subscriber failed")
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        refresher.subscribe(failing)
+        refresher.subscribe(queue)
+
+        await run_until_done(refresher, client)
+
+        assert len(client.calls) >= 4
+        assert queue.get_nowait().target.kwargs["country_code"] == "es"
+
+    @pytest.mark.asyncio
+    async def test_publication_priority(self):
+        client = FakeClient(calls_until_done=4)
+        publication = datetime.now(timezone.utc) + timedelta(seconds=0.3)
+        refresher = AlsiRefresher(
+            client,
+            [
+                WatchTarget(
+                    METHOD,
+                    {"country_code": "fr"},
+                    3600,
+                    publication.time(),
+                ),
+                WatchTarget(METHOD, {"country_code": "be"}, 0.01),
+            ],
+            min_spacing=0.25,
+            publication_grace=0,
+        )
+
+        await run_until_done(refresher, client)
+
+        # at 0.5s "be" has been due longer, but "fr" was just published
+        assert client.calls == ["fr", "be", "fr", "be"]
+
+    @pytest.mark.asyncio
+    async def test_pending_publication_does_not_starve(self):
+        client = FakeClient(calls_until_done=6)
+        publication = datetime.now(timezone.utc) + timedelta(seconds=3)
+        refresher = AlsiRefresher(
+            client,
+            [
+                WatchTarget(METHOD, {"country_code": "be"}, 0.05),
+                WatchTarget(
+                    METHOD,
+                    {"country_code": "fr"},
+                    3600,
+                    publication.time(),
+                ),
+            ],
+            min_spacing=0.01,
+            publication_grace=0,
+        )
+
+        await run_until_done(refresher, client)
+
+        assert client.calls == ["be", "fr", "be", "be", "be", "be"]
+        gaps = [b - a for a, b in zip(client.started[2:], client.started[3:])]
+        assert max(gaps) < 0.05 + 0.04
@@ -0,0 +1,89 @@
+from alsi.exceptions import AccessDeniedException, MissingFixtureException
+from alsi.pandas_client import AlsiPandasClient
+from alsi.raw_client import AlsiRawClient
+from alsi.transport import (
+    AlsiTransport,
+    RecordingTransport,
+    ReplayTransport,
+    request_key,
+)
+from datetime import datetime
+import pytest, json, time
+
+ROWS = [{"code": "BE", "gasDayStartedOn": "2022-01-01", "dtmi": "1.5"}]
+
+
+class FakeTransport(AlsiTransport):
+    def __init__(self):
+        self.requests = []
+        self.closed = False
+
+    async def get(self, url, params):
+        self.requests.append(request_key(url, params))
+        if url.endswith("/FR"):
+            return "access denied"
+        return json.dumps(ROWS)
+
+    async def close(self):
+        self.closed = True
+
+
+class TestTransport:
+    def test_incomplete_transport(self):
+        class IncompleteTransport(AlsiTransport):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteTransport()
+
+    def test_request_key(self):
+        assert request_key("url", {}) == "url"
+        assert (
+            request_key("url", {"till": "2022-01-02", "from": "2022-01-01"})
+            == "url?from=2022-01-01&till=2022-01-02"
+        )
+
+    @pytest.mark.asyncio
+    async def test_record_and_replay(self, tmp_path):
+        path = tmp_path / "fixtures" / "client.json.gz"
+        inner = FakeTransport()
+        client = AlsiRawClient(
+            "dummy_key", transport=RecordingTransport(inner, path)
+        )
+
+        recorded = await client.query_agg_data_by_country(
+            "be", start=datetime(2022, 1, 1)
+        )
+        with pytest.raises(AccessDeniedException):
+            await client.query_agg_data_by_country("fr")
+        await client.close_session()
+
+        assert inner.closed
+        assert recorded == ROWS
+
+        client = AlsiPandasClient("dummy_key", transport=ReplayTransport(path))
+        df = await client.query_agg_data_by_country(
+            "be", start=datetime(2022, 1, 1)
+        )
+
+        assert df.to_dict("records") == ROWS
+
+        with pytest.raises(AccessDeniedException):
+            await client.query_agg_data_by_country("fr")
+
+        with pytest.raises(MissingFixtureException):
+            await client.query_agg_data_by_country("be")
+
+        await client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_replay_latency(self, tmp_path):
+        path = tmp_path / "client.json.gz"
+        recording = RecordingTransport(FakeTransport(), path)
+        await recording.get("url", {})
+        recording.save()
+
+        transport = ReplayTransport(path, latency=0.05)
+        started = time.monotonic()
+        assert json.loads(await transport.get("url", {})) == ROWS
+        assert time.monotonic() - started >= 0.05